@@ -8,8 +8,7 @@ import functools
 import string
 import random
 import re
-import types
-from typing import Dict, List, Optional, TYPE_CHECKING
+from typing import Dict, Iterable, List, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from types import FunctionType
@@ -17,16 +16,22 @@ if TYPE_CHECKING:
 SEPS = None
 ENCODING_INDEXES = None
 DECODING_INDEXES = None
+_DECODING_TABLE = None
+_SPLITTING_TABLE = None
+_FIRST_LETTERS = None
+_DIGIT_LETTERS = None
 __version__ = "2.0.0"
 
 __all__ = (
-    "CharabiaError"
+    "CharabiaError",
     "__version__",
     "configured",
     "create_tower",
     "decode",
+    "decode_many",
     "demolish_tower",
     "encode",
+    "encode_many",
     "ensure_setsep",
     "generate_decoding_indexes",
     "generate_encoding_indexes",
@@ -59,13 +64,43 @@ def setseps(separators: str) -> None:
         The separators to configure. Must be alphanumeric and provided
         string length must be between 1 and 42.
     """
-    _parse_separators(separators)
     global SEPS
     global ENCODING_INDEXES
     global DECODING_INDEXES
-    SEPS = "".join(list(dict.fromkeys(separators)))
+    global _DECODING_TABLE
+    global _SPLITTING_TABLE
+    global _FIRST_LETTERS
+    global _DIGIT_LETTERS
+    _parse_separators(separators)
+    SEPS = "".join(dict.fromkeys(separators))
     ENCODING_INDEXES = generate_encoding_indexes(SEPS)
-    DECODING_INDEXES = generate_decoding_indexes(SEPS)
+    DECODING_INDEXES = generate_decoding_indexes(SEPS, ENCODING_INDEXES)
+    # Anything which isn't an encoding letter or a separator is mapped to a
+    # null byte so it fails validation in decode().
+    if SEPS.isascii():
+        _DECODING_TABLE = bytearray(256)
+        for char, digit in DECODING_INDEXES.items():
+            if digit:
+                _DECODING_TABLE[ord(char)] = ord(digit)
+        _DECODING_TABLE = bytes(_DECODING_TABLE)
+    else:
+        # Non-ASCII separators can't go through a byte table, so fall back
+        # to str.translate(). Unmapped characters pass through it unchanged,
+        # hence spaces and digits which aren't separators are listed.
+        _DECODING_TABLE = str.maketrans(
+            {**dict.fromkeys(" " + string.digits, "\0"), **DECODING_INDEXES}
+        )
+    # Maps every separator onto the first one, so splitseps() can use str.split().
+    _SPLITTING_TABLE = str.maketrans(dict.fromkeys(SEPS[1:], SEPS[0]))
+    _DIGIT_LETTERS = tuple("".join(ENCODING_INDEXES[n]) for n in range(10))
+    # Separators may use up every letter of a digit, which is left untranslated.
+    _FIRST_LETTERS = str.maketrans({str(n): v[0] for n, v in ENCODING_INDEXES.items() if v})
+    _FIRST_ENCODINGS.clear()
+    # ASCII encodings are prepared upfront, anything else on first use.
+    for cp in range(128):
+        encoded = str(cp).translate(_FIRST_LETTERS)
+        if encoded.isalpha():
+            _FIRST_ENCODINGS[cp] = encoded
 
 
 def getseps() -> Optional[str]:
@@ -81,22 +116,34 @@ def generate_encoding_indexes(seps) -> Dict[int, List[str]]:
     }
 
 
-def generate_decoding_indexes(seps) -> Dict[str, str]:
-    """Generate decoding indexes for the provided separators."""
+def generate_decoding_indexes(
+    seps, encoding_indexes: Optional[Dict[int, List[str]]] = None
+) -> Dict[str, str]:
+    """Generate decoding indexes for the provided separators.
+
+    Pass the encoding indexes of the same separators if they were already
+    generated, to avoid generating them again.
+    """
+    if encoding_indexes is None:
+        encoding_indexes = generate_encoding_indexes(seps)
     return dict(
-        {i: str(k) for k, v in generate_encoding_indexes(seps).items() for i in v},
+        {i: str(k) for k, v in encoding_indexes.items() for i in v},
         **{sep: " " for sep in seps},
         **{"\n": ""},
     )
 
 
-def ensure_setsep(f) -> FunctionType:
+def _ensure_configured() -> None:
+    if not configured():
+        raise RuntimeError(
+            "separators have not been declared, or the configuration has been damaged (please use setseps())"
+        )
+
+
+def ensure_setsep(f) -> "FunctionType":
     @functools.wraps(f)
     def inner(*args, **kwargs):
-        if not configured():
-            raise RuntimeError(
-                "separators have not been declared, or the configuration has been damaged (please use setseps())"
-            )
+        _ensure_configured()
         return f(*args, **kwargs)
 
     return inner
@@ -104,7 +151,7 @@ def ensure_setsep(f) -> FunctionType:
 
 def configured() -> bool:
     """Returns whether charabia is fully configured and safe for encoding/decoding."""
-    return all([SEPS, ENCODING_INDEXES, DECODING_INDEXES])
+    return SEPS is not None and ENCODING_INDEXES is not None and DECODING_INDEXES is not None
 
 
 def create_tower(string: str, tower_rows: int) -> str:
@@ -115,7 +162,7 @@ def create_tower(string: str, tower_rows: int) -> str:
     string: str
         The string to build the tower upon.
 
-    tower_rows: str
+    tower_rows: int
         Characters per line, separated by a line break. Set to 0 to
         disable linewrapping entirely.
 
@@ -123,11 +170,16 @@ def create_tower(string: str, tower_rows: int) -> str:
     -------
     str
         The tower string.
+
+    Raises
+    ------
+    ValueError
+        If tower_rows is negative.
     """
     if not tower_rows:
-        if "\n" in string:
-            string = "".join(string.split("\n"))
-        return string
+        return string.replace("\n", "")
+    if tower_rows < 0:
+        raise ValueError("tower_rows must not be negative")
     return "\n".join([string[x : x + tower_rows] for x in range(0, len(string), tower_rows)])
 
 
@@ -147,20 +199,49 @@ def demolish_tower(string: str) -> str:
     return create_tower(string, 0)
 
 
+class _EncodingTable(dict):
+    """Codepoint to unseeded encoding lookup table, filled on first use."""
+
+    def __missing__(self, cp: int) -> str:
+        # Unseeded encodings only depend on the separator configuration,
+        # so each codepoint is computed once and kept until setseps().
+        encoded = str(cp).translate(_FIRST_LETTERS)
+        if not encoded.isalpha():
+            raise CharabiaError(
+                "cannot encode %r, configuration %s leaves no letters for one of its digits"
+                % (chr(cp), SEPS)
+            )
+        self[cp] = encoded
+        return encoded
+
+
+_FIRST_ENCODINGS = _EncodingTable()
+
+
 def _encode(text: str, seed: bool):
+    if not text:
+        return ""
     if seed:
-        func = random.choice
-    else:
-        func = lambda x: x[0]
-    joinords = lambda n: "".join(map(lambda x: func(ENCODING_INDEXES[x]), map(int, str(n))))
-    compiled = list(map(joinords, map(ord, text)))
-    return "".join(
-        f"{j}{random.choice(SEPS) if i + 1 != len(compiled) else ''}"
-        for i, j in enumerate(compiled)
-    )
+        # The unseeded encoding spells each digit with the first letter of its
+        # index, so reuse those cached strings rather than calling str() on every
+        # codepoint. Every random letter and separator is then drawn upfront,
+        # one random.choices() call per digit, and handed out in order.
+        firsts = " ".join(map(_FIRST_ENCODINGS.__getitem__, map(ord, text)))
+        picks = {}
+        for letters in _DIGIT_LETTERS:
+            if not letters:
+                continue
+            picks[letters[0]] = iter(random.choices(letters, k=firsts.count(letters[0])))
+        picks[" "] = iter(random.choices(SEPS, k=len(text) - 1))
+        return "".join(map(next, map(picks.__getitem__, firsts)))
+    compiled = list(map(_FIRST_ENCODINGS.__getitem__, map(ord, text)))
+    # Interleave the encoded characters with their separators.
+    joined = [None] * (len(compiled) * 2 - 1)
+    joined[::2] = compiled
+    joined[1::2] = random.choices(SEPS, k=len(compiled) - 1)
+    return "".join(joined)
 
 
-@ensure_setsep
 def encode(text: str, *, seeded: bool = True, tower_rows: int = 0) -> str:
     """Encode text into charabia.
 
@@ -184,12 +265,39 @@ def encode(text: str, *, seeded: bool = True, tower_rows: int = 0) -> str:
     str
         The encoded text.
     """
-
+    _ensure_configured()
     encoded = _encode(text, seeded)
     return create_tower(string=encoded, tower_rows=tower_rows)
 
 
-@ensure_setsep
+def encode_many(texts: Iterable[str], *, seeded: bool = True, tower_rows: int = 0) -> List[str]:
+    """Encode several texts into charabia at once.
+
+    The configuration is only checked once for the whole batch.
+
+    Parameters
+    ----------
+    texts: Iterable[str]
+        The texts to encode.
+
+    seeded: bool
+        Whether each encoded character should be chose at random from the
+        encoding index, or whether only the first index is ever taken. Defaults
+        to randomization (True).
+
+    tower_rows: int
+        Characters per line, separated by a line break. Set to 0 to disable linewrapping
+        entirely, this is done be default.
+
+    Returns
+    -------
+    List[str]
+        The encoded texts, in the same order.
+    """
+    _ensure_configured()
+    return [create_tower(string=_encode(text, seeded), tower_rows=tower_rows) for text in texts]
+
+
 def decode(text: str) -> str:
     """Decode text from charabia.
 
@@ -203,33 +311,57 @@ def decode(text: str) -> str:
     str
         The decoded text.
     """
-    m = ""
-    error = False
+    _ensure_configured()
+    return _decode(text)
+
+
+def decode_many(texts: Iterable[str]) -> List[str]:
+    """Decode several texts from charabia at once.
+
+    The configuration is only checked once for the whole batch.
+
+    Parameters
+    ----------
+    texts: Iterable[str]
+        The texts to decode.
+
+    Returns
+    -------
+    List[str]
+        The decoded texts, in the same order.
+    """
+    _ensure_configured()
+    return list(map(_decode, texts))
 
+
+def _decode(text: str) -> str:
     def raise_(message="failed to decode with configuration " + SEPS):
         raise CharabiaError(message) from None
 
-    try:
-        items = ["".join(map(DECODING_INDEXES.__getitem__, s)) for s in splitseps(text)]
-    except KeyError as e:
-        m = "Unexpected character in token: %s" % e
-        if e.args[0] == " ":
-            m = "Spaces shouldn't appear inside decode(). Perhaps you meant to use encode()?"
-        raise_(m)
+    # With ASCII separators charabia is pure ASCII, so decode one byte per
+    # character rather than a full unicode string. Either way, anything left
+    # outside ASCII becomes "?", which is invalid.
+    if isinstance(_DECODING_TABLE, bytes):
+        digits = text.encode("ascii", "replace").translate(_DECODING_TABLE, b"\n")
     else:
-        for i in items:
-            try:
-                i = int(i)
-            except (OverflowError, ValueError):
-                error = True
-            else:
-                if i not in range(1114112):
-                    error = True
-            finally:
-                if error:
-                    raise_()
-                m += chr(i)
-    return m
+        digits = text.translate(_DECODING_TABLE).encode("ascii", "replace")
+    if not digits.replace(b" ", b"").isdigit():
+        for c in text:
+            if c not in DECODING_INDEXES:
+                m = "Unexpected character in token: %r" % c
+                if c == " ":
+                    m = "Spaces shouldn't appear inside decode(). Perhaps you meant to use encode()?"
+                raise_(m)
+    tokens = digits.split(b" ")
+    if max(map(len, tokens)) > 7:
+        # max ord: 1114111 (len(7)), don't bother parsing anything longer
+        raise_()
+    # Tokens are now short ASCII digits, so int() only fails on empty tokens
+    # and chr() on codepoints beyond the unicode range.
+    try:
+        return "".join(map(chr, map(int, tokens)))
+    except ValueError:
+        raise_()
 
 
 @contextlib.contextmanager
@@ -241,7 +373,16 @@ def tempseps(separators: str):
     try:
         yield
     finally:
-        SEPS = original
+        if original is None:
+            SEPS = None
+        else:
+            setseps(original)
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_seps(separators: str) -> "re.Pattern":
+    # A character class is matched in a single step, unlike an alternation.
+    return re.compile("[%s]" % re.escape(separators))
 
 
 def splitseps(text: str, separators: Optional[str] = None) -> List[str]:
@@ -251,9 +392,12 @@ def splitseps(text: str, separators: Optional[str] = None) -> List[str]:
             raise RuntimeError(
                 "splitseps separator argument must not be omitted when charabia has not been configured"
             )
-        separators = SEPS
-    split = re.split("|".join(separators), text)
-    if any(len(x) > 7 for x in split):
+        split = text.translate(_SPLITTING_TABLE).split(SEPS[0])
+    elif not separators:
+        raise ValueError("separators length must be between 1 and 42")
+    else:
+        split = _compile_seps(separators).split(text)
+    if max(map(len, split)) > 7:
         # max ord: 1114111 (len(7))
         raise CharabiaError(
             "The provided charabia does not seem valid for the associated separator configuration"